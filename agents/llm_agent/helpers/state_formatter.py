@@ -352,7 +352,7 @@ class StateFormatter:
             "type": getattr(enemy.kind, "name", str(enemy.kind)),
             "position": {"x": enemy.position[0], "y": enemy.position[1]},
             "distance_from_nearest_friendly": round(nearest_dist, 1) if nearest_dist is not None else None,
-            "detected_by": list(enemy.seen_by),
+            "detected_by": sorted(enemy.seen_by),
         }
 
     def _dead_entities(
@@ -10,7 +10,6 @@ from env.core.actions import Action
 from env.core.types import Team
 from env.world import WorldState
 from ..base_agent import BaseAgent
-from ..team_intel import TeamIntel
 from ..registry import register_agent
 
 if TYPE_CHECKING:
@@ -63,16 +62,15 @@ class RandomAgent(BaseAgent):
             Tuple of (actions, metadata)
         """
         world: WorldState = state["world"]
-        intel: TeamIntel = TeamIntel.build(world, self.team)
         actions = {}
-        
-        for entity in intel.friendlies:
-            if not entity.alive:
-                continue
+        choice = self.rng.choice
+
+        # Only friendly entities are needed; skip building the full TeamIntel
+        for entity in world.get_team_entities(self.team):
             allowed = entity.get_allowed_actions(world)
             if not allowed:
                 continue
-            actions[entity.id] = self.rng.choice(allowed)
+            actions[entity.id] = choice(allowed)
         
         metadata = {
             "policy": "random",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, TYPE_CHECKING
+from typing import Dict, FrozenSet, List, Optional, Set, TYPE_CHECKING
 
 from env.core.types import EntityKind, GridPos, Team, MoveDir
 from env.entities.base import Entity
@@ -24,7 +24,7 @@ class VisibleEnemy:
     position: GridPos
     kind: EntityKind
     has_fired_before: bool
-    seen_by: Set[int]
+    seen_by: FrozenSet[int]
 
 
 @dataclass(frozen=True)
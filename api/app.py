@@ -1,6 +1,10 @@
 """HTTP API entrypoint for driving the game from a web UI."""
 
-from pathlib import Path
+import asyncio
+import os
+import webbrowser
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -15,7 +19,42 @@ from runtime.logfire_config import configure_logfire
 # Configure observability before app/agent imports are used.
 configure_logfire()
 
-app = FastAPI()
+
+# Set by main.py for local launches: UI address to open once the server is
+# accepting connections (unset = do not open a browser).
+OPEN_BROWSER_ENV = "WG_OPEN_BROWSER_URL"
+
+
+async def _open_browser_when_ready(url: str, timeout: float = 5.0) -> None:
+    """Open the UI as soon as the server accepts connections (opens anyway on timeout)."""
+    # Poll the port instead of sleeping a fixed delay.
+    parts = urlsplit(url)
+    host = "127.0.0.1" if parts.hostname in (None, "", "0.0.0.0") else parts.hostname
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, parts.port), 0.05)
+        except (OSError, asyncio.TimeoutError):
+            await asyncio.sleep(0.02)
+            continue
+        writer.close()
+        break
+    webbrowser.open(url)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup runs before uvicorn binds the port, so the opener waits in a task.
+    url = app.state.open_browser_url
+    opener = asyncio.create_task(_open_browser_when_ready(url)) if url else None
+    yield
+    if opener is not None:
+        opener.cancel()
+
+
+app = FastAPI(lifespan=lifespan)
+app.state.open_browser_url = os.environ.get(OPEN_BROWSER_ENV)
 runner: GameRunner | None = None
 
 
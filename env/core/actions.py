@@ -16,7 +16,7 @@ import json
 from .types import ActionType, MoveDir
 
 
-@dataclass
+@dataclass(frozen=True)
 class Action:
     """
     An action that can be performed by an entity.
@@ -33,6 +33,9 @@ class Action:
     Or construct directly:
         - Action(ActionType.WAIT)
         - Action(ActionType.MOVE, {"dir": MoveDir.UP})
+
+    Actions are immutable; wait() and move() return shared instances,
+    so params must not be modified after construction.
     """
 
     type: ActionType
@@ -78,16 +81,21 @@ class Action:
         Returns:
             Dictionary representation of the action
         """
-        params_dict = {}
-        for key, value in self.params.items():
-            if isinstance(value, MoveDir):
-                params_dict[key] = value.name
-            else:
-                params_dict[key] = value
-
         return {
             "type": self.type.name,
-            "params": params_dict
+            "params": self.params_to_dict()
+        }
+
+    def params_to_dict(self) -> Dict[str, Any]:
+        """
+        Convert only the parameters to a JSON-serializable dictionary.
+
+        Returns:
+            Copy of params with MoveDir values replaced by their names
+        """
+        return {
+            key: value.name if isinstance(value, MoveDir) else value
+            for key, value in self.params.items()
         }
 
     @classmethod
@@ -145,9 +153,10 @@ class Action:
         Create a WAIT action.
 
         Returns:
-            Action that makes the entity wait and do nothing this turn.
+            Action that makes the entity wait and do nothing this turn
+            (shared instance).
         """
-        return Action(ActionType.WAIT)
+        return _WAIT_ACTION
 
     @staticmethod
     def move(direction: MoveDir) -> Action:
@@ -158,9 +167,10 @@ class Action:
             direction: Direction to move (UP, DOWN, LEFT, RIGHT)
 
         Returns:
-            Action that moves the entity in the specified direction.
+            Action that moves the entity in the specified direction
+            (shared instance).
         """
-        return Action(ActionType.MOVE, {"dir": direction})
+        return _MOVE_ACTIONS[direction]
 
     @staticmethod
     def shoot(target_id: int) -> Action:
@@ -189,6 +199,8 @@ class Action:
         return Action(ActionType.TOGGLE, {"on": on})
 
 
-
-
-
+# Parameterless/enum-keyed actions are built once and shared (see Action.wait/move)
+_WAIT_ACTION = Action(ActionType.WAIT)
+_MOVE_ACTIONS: Dict[MoveDir, Action] = {
+    direction: Action(ActionType.MOVE, {"dir": direction}) for direction in MoveDir
+}
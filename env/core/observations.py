@@ -10,13 +10,14 @@ This module provides:
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Set, List, Dict, Optional
+from typing import FrozenSet, Set, List, Dict, Optional
+import copy
 import json
 
 from .types import Team, GridPos, EntityKind
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """
     An observation of an entity by another entity.
@@ -35,7 +36,9 @@ class Observation:
         kind: Type of entity (may be deceptive for decoys observed by enemies)
         team: Team affiliation
         position: Grid position
-        seen_by: Set of entity IDs that can see this entity
+        seen_by: Immutable set of entity IDs that can see this entity
+            (singleton sets are shared between observations, so merges
+            replace the set rather than mutate it)
         has_fired_before: Whether this entity has ever fired (from team intel)
     """
 
@@ -43,7 +46,7 @@ class Observation:
     kind: EntityKind
     team: Team
     position: GridPos
-    seen_by: Set[int] = field(default_factory=set)
+    seen_by: FrozenSet[int] = field(default_factory=frozenset)
     has_fired_before: bool = False
 
     def is_friendly(self, observer_team: Team) -> bool:
@@ -65,8 +68,8 @@ class Observation:
             "entity_id": self.entity_id,
             "kind": self.kind.value,  # Serialize enum as string value
             "team": self.team.value,
-            "position": list(self.position),
-            "seen_by": list(self.seen_by),
+            "position": self.position,  # tuple; encodes as a JSON array
+            "seen_by": sorted(self.seen_by),
             "has_fired_before": self.has_fired_before,
         }
 
@@ -86,7 +89,7 @@ class Observation:
             kind=EntityKind(data["kind"]),  # Deserialize string back to enum
             team=Team(data["team"]),
             position=tuple(data["position"]),
-            seen_by=set(data["seen_by"]),
+            seen_by=frozenset(data["seen_by"]),
             has_fired_before=data.get("has_fired_before", False),
         )
 
@@ -127,7 +130,7 @@ class ObservationSet:
         """
         if obs.entity_id in self.observations:
             existing = self.observations[obs.entity_id]
-            existing.seen_by.update(obs.seen_by)
+            existing.seen_by = existing.seen_by | obs.seen_by
             existing.has_fired_before = existing.has_fired_before or obs.has_fired_before
         else:
             self.observations[obs.entity_id] = obs
@@ -181,6 +184,15 @@ class ObservationSet:
         """Clear all observations."""
         self.observations.clear()
 
+    def copy(self) -> ObservationSet:
+        """
+        Copy the set; observations are copied too, so merges into either
+        set never affect the other.
+        """
+        return ObservationSet(
+            observations={eid: copy.copy(obs) for eid, obs in self.observations.items()}
+        )
+
     def __len__(self) -> int:
         """Number of unique entities observed."""
         return len(self.observations)
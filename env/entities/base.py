@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -188,6 +189,25 @@ class Entity(ABC):
             return 0.0
         return self.radar_range
 
+    def post_fire_hook(self) -> None:
+        """
+        Called by CombatResolver after this entity fires a missile.
+
+        No-op by default; subclasses override for post-shot mechanics
+        (e.g., SAM cooldown).
+        """
+        pass
+
+    def is_invisible_to_enemies(self) -> bool:
+        """
+        Whether sensors should skip this entity entirely.
+
+        Returns:
+            False by default; subclasses override for stealth mechanics
+            (e.g., SAM with radar OFF)
+        """
+        return False
+
     def label(self) -> str:
         """
         Get a human-readable label for this entity.
@@ -304,6 +324,19 @@ class Entity(ABC):
         """Deserialize entity from JSON string."""
         return cls.from_dict(json.loads(json_str))
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Entity:
+        """
+        Deep copy the entity.
+
+        Entity fields are immutable values (ints, floats, bools, strings,
+        enums, position tuples), so a field-level copy is already deep and
+        skips copy.deepcopy's per-field recursion. Subclasses that add
+        mutable fields must override this.
+        """
+        clone = copy.copy(self)
+        memo[id(self)] = clone
+        return clone
+
     def __str__(self) -> str:
         """String representation for debugging."""
         status = "alive" if self.alive else "dead"
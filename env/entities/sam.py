@@ -177,6 +177,19 @@ class SAM(Entity):
         """
         self._cooldown = self.cooldown_steps
 
+    def post_fire_hook(self) -> None:
+        """Start the cooldown timer after firing."""
+        self.start_cooldown()
+
+    def is_invisible_to_enemies(self) -> bool:
+        """
+        SAMs are only visible when their radar is ON.
+
+        Returns:
+            True if radar is OFF
+        """
+        return not self.on
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize SAM to dictionary."""
         data = super().to_dict()
@@ -96,15 +96,18 @@ class GridCombatEnv:
         verbose: Whether to print detailed logs
     """
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, logging_enabled: bool = True):
         """
         Initialize the Grid Combat Environment.
         
         Args:
             verbose: Print detailed logs each turn (default: False)
+            logging_enabled: Build human-readable combat/death logs in
+                StepInfo (default: True). Disable for headless runs.
         """
         # Logging settings
         self.verbose = verbose
+        self.logging_enabled = logging_enabled
         
         # World state (will be initialized in reset())
         self.world: Optional[WorldState] = None
@@ -118,11 +121,15 @@ class GridCombatEnv:
         # Victory checker (will be initialized in reset())
         self._victory_checker: Optional[VictoryConditions] = None
 
+        # Initial world kept by reset(keep_template=True) for reset_fast()
+        self._reset_template: Optional[WorldState] = None
+
     # For continuation games, we might reset the env with scenario and world and fix the initialization logic accordingly.
     def reset(
         self, 
         scenario: Scenario | Dict[str, Any],
         world: WorldState | Dict[str, Any] | None = None,
+        keep_template: bool = False,
     ) -> Dict[str, Any]:
         """
         Reset the environment with a scenario, optionally using an existing world.
@@ -142,6 +149,8 @@ class GridCombatEnv:
             world: Optional WorldState or dict (from WorldState.to_dict()).
                 If provided, the environment will resume from this world
                 instead of creating a new one from the scenario entities.
+            keep_template: Keep a copy of the initial world so reset_fast()
+                can replay it (default: False)
         
         Returns:
             Initial state (same structure as step())
@@ -217,12 +226,36 @@ class GridCombatEnv:
                 )
 
             self.world = world_obj
+
+        self.world.logging_enabled = self.logging_enabled
         
         # Refresh observations after adding entities
         self._sensors.refresh_all_observations(self.world)
+        self._reset_template = self.world.snapshot() if keep_template else None
         
         # Return initial state
         return self._build_state()
+
+    def reset_fast(self) -> Dict[str, Any]:
+        """
+        Restart the current scenario from its initial world.
+
+        Restores a copy of the world kept by reset(..., keep_template=True),
+        skipping the scenario clone, entity placement and initial sensor
+        pass. The RNG state is restored as well, so each replay matches
+        reset(scenario) for a seeded scenario; call reset() instead to get a
+        fresh random draw for an unseeded one.
+
+        Returns:
+            Initial state (same structure as reset())
+
+        Raises:
+            RuntimeError: If the last reset() did not keep a template
+        """
+        if self._reset_template is None:
+            raise RuntimeError("Must call reset(..., keep_template=True) before calling reset_fast()")
+        self.world = self._reset_template.snapshot()
+        return self._build_state()
     
     def step(
         self, 
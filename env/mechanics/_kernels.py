@@ -0,0 +1,94 @@
+"""
+Numeric kernels shared by the mechanics systems.
+
+These are the innermost per-shot / per-pair loops, kept free of entity
+objects and world lookups so they only touch plain numbers and lists:
+- hit_probability_kernel: Hit chance for already-validated weapon stats
+- in_range_pairs: Observer/target pairs that fall inside radar range
+"""
+
+from __future__ import annotations
+import math
+from bisect import bisect_left, bisect_right
+from typing import List, Sequence, Tuple
+
+from ..core.types import GridPos
+
+
+def hit_probability_kernel(
+    distance: float,
+    max_range: float,
+    base: float,
+    min_p: float,
+) -> float:
+    """
+    Linear hit-probability falloff without parameter validation.
+
+    Callers must have validated the inputs already (see combat.hit_probability):
+    distance >= 0, max_range > 0 and 0 <= min_p <= base <= 1.
+
+    Args:
+        distance: Distance to target
+        max_range: Maximum effective range
+        base: Hit probability at distance 0
+        min_p: Hit probability at max range
+
+    Returns:
+        Hit probability, or 0.0 beyond max_range
+    """
+    # Linear interpolation: base at 0, min_p at max_range (inclusive)
+    if distance > max_range:
+        return 0.0
+
+    frac = max(0.0, min(1.0, distance / max_range))
+    return base - (base - min_p) * frac
+
+
+def in_range_pairs(
+    positions: Sequence[GridPos],
+    radars: Sequence[float],
+    hidden: Sequence[bool],
+) -> Tuple[List[int], List[int]]:
+    """
+    Find every (observer, target) pair where the target is within radar range.
+
+    Rows are sorted by x once; each observer only measures the rows whose x
+    lies within its radar range (found by bisection), so distances are
+    computed for nearby candidates instead of every pair.
+
+    Pairs are produced observer-major, targets in row order, which keeps
+    observation insertion order stable for consumers.
+
+    Args:
+        positions: Position per row (x, y)
+        radars: Active radar range per row (<= 0 means the row cannot observe)
+        hidden: Whether each row is invisible as a target
+
+    Returns:
+        Tuple of (observer rows, target rows), aligned by index
+    """
+    obs_idx: List[int] = []
+    tgt_idx: List[int] = []
+
+    n = len(positions)
+    by_x = sorted(range(n), key=lambda row: positions[row][0])
+    xs = [positions[row][0] for row in by_x]
+    hypot = math.hypot
+
+    for i in range(n):
+        active_radar = radars[i]
+        if active_radar <= 0:
+            continue
+
+        ax, ay = positions[i]
+        lo = bisect_left(xs, ax - active_radar)
+        hi = bisect_right(xs, ax + active_radar)
+        for j in sorted(by_x[lo:hi]):
+            if j == i or hidden[j]:
+                continue
+            bx, by = positions[j]
+            if hypot(ax - bx, ay - by) <= active_radar:
+                obs_idx.append(i)
+                tgt_idx.append(j)
+
+    return obs_idx, tgt_idx
@@ -11,13 +11,16 @@ This module handles:
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
 from dataclasses import dataclass
+import functools
 import random
 
 from ..core.types import ActionType
 from ..core.actions import Action
 from ..core.validation import validate_action_in_world
+from ._kernels import hit_probability_kernel
+from .squares_rng import squares_random
 
 if TYPE_CHECKING:
     from ..world.world import WorldState
@@ -57,11 +60,34 @@ def hit_probability(
         0.0
     """
 
-    # Validate inputs
-    if distance < 0:
-        raise ValueError(f"Distance cannot be negative: {distance}")
+    return _hit_fn(max_range, base, min_p)(distance)
+
+
+@functools.lru_cache(maxsize=None)
+def _hit_fn(max_range: float, base: float, min_p: float) -> Callable[[float], float]:
+    """
+    Build the hit-probability curve for one set of weapon stats.
+
+    Weapon stats are per-entity constants, so parameter validation is done
+    once per distinct (max_range, base, min_p) and the returned closure only
+    runs the distance-dependent kernel.
+
+    Args:
+        max_range: Maximum effective range
+        base: Base hit probability at distance 0
+        min_p: Minimum hit probability at max range
+
+    Returns:
+        Callable mapping distance -> hit probability (see hit_probability)
+    """
     if max_range <= 0:
-        return 0.0
+        def no_range(distance: float) -> float:
+            if distance < 0:
+                raise ValueError(f"Distance cannot be negative: {distance}")
+            return 0.0
+        return no_range
+
+    # Validate inputs
     if not 0 <= base <= 1:
         raise ValueError(f"Base probability must be in [0, 1]: {base}")
     if not 0 <= min_p <= 1:
@@ -69,14 +95,12 @@ def hit_probability(
     if min_p > base:
         raise ValueError(f"Min probability ({min_p}) cannot exceed base ({base})")
 
-    # Linear interpolation: base at 0, min_p at max_range (inclusive)
-    if distance > max_range:
-        return 0.0
-
-    frac = max(0.0, min(1.0, distance / max_range))
-    probability = base - (base - min_p) * frac
+    def curve(distance: float) -> float:
+        if distance < 0:
+            raise ValueError(f"Distance cannot be negative: {distance}")
+        return hit_probability_kernel(distance, max_range, base, min_p)
 
-    return probability
+    return curve
 
 
 @dataclass
@@ -92,7 +116,8 @@ class CombatResult:
         distance: Distance to target (None if invalid)
         hit_probability: Calculated hit probability (None if not fired)
         target_killed: Whether target was killed
-        log: Human-readable log message
+        log: Human-readable log message (None for fired shots when
+            world.logging_enabled is False; raw fields above still apply)
     """
     attacker_id: int
     target_id: int | None
@@ -101,7 +126,7 @@ class CombatResult:
     distance: float | None
     hit_probability: float | None
     target_killed: bool
-    log: str
+    log: str | None
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize combat result to a plain dict."""
@@ -233,7 +258,7 @@ class CombatResolver:
             killed_entity_ids=killed_entity_ids,
             combat_occurred=combat_occurred
         )
-    
+
     def resolve_all(
         self,
         world: WorldState,
@@ -256,20 +281,19 @@ class CombatResolver:
         """
         results = []
         
-        # Get all entities that want to shoot
-        shooting_entities = []
-        for entity in world.get_alive_entities():
-            action = actions.get(entity.id)
-            if action and action.type == ActionType.SHOOT:
-                shooting_entities.append(entity)
+        # Get all entities that want to shoot, paired with their action
+        shooting_pairs = [
+            (entity, action)
+            for entity in world.get_alive_entities()
+            if (action := actions.get(entity.id)) and action.type == ActionType.SHOOT
+        ]
         
         # Randomize order to prevent ID bias
         if randomize_order:
-            world.rng.shuffle(shooting_entities)
+            world.rng.shuffle(shooting_pairs)
         
         # Process each shot
-        for entity in shooting_entities:
-            action = actions[entity.id]
+        for entity, action in shooting_pairs:
             result = self.resolve_single(world, entity, action)
             results.append(result)
         
@@ -329,28 +353,27 @@ class CombatResolver:
         # Calculate distance for hit probability calculation
         distance = world.grid.distance(attacker.pos, target.pos)
         
-        # Calculate hit probability
-        prob = hit_probability(
-            distance=distance,
-            max_range=attacker.missile_max_range,
-            base=attacker.base_hit_prob,
-            min_p=attacker.min_hit_prob
-        )
-        
-        # Use world RNG or our own
-        rng = self._rng if self._rng is not None else world.rng
-        
-        # Roll for hit
-        roll = rng.random()
+        # Calculate hit probability (curve is cached per weapon stats)
+        prob = _hit_fn(
+            attacker.missile_max_range,
+            attacker.base_hit_prob,
+            attacker.min_hit_prob
+        )(distance)
+        
+        # Roll for hit. By default the roll is a counter-based draw keyed by
+        # (turn, attacker), so it does not depend on shot order or on other
+        # consumers of world.rng. An injected RNG takes precedence (testing).
+        if self._rng is not None:
+            roll = self._rng.random()
+        else:
+            roll = squares_random((world.turn << 32) | attacker.id, world.rng_key)
         hit = roll <= prob
         
         # Consume missile
         attacker.missiles -= 1
         
-        # Handle SAM cooldown
-        from ..entities.sam import SAM
-        if isinstance(attacker, SAM):
-            attacker.start_cooldown()
+        # Post-shot mechanics (e.g., SAM cooldown)
+        attacker.post_fire_hook()
         
         # Apply kill if hit
         target_killed = False
@@ -362,12 +385,14 @@ class CombatResolver:
         enemy_team_view = world.get_team_view(target.team)
         enemy_team_view.record_enemy_fired(attacker.id)
         
-        # Generate log
-        hit_str = "HIT" if hit else "MISS"
-        log = (
-            f"{attacker.label()} fires at {target.label()} "
-            f"(d={distance:.1f}, p={prob:.2f}, roll={roll:.2f}) -> {hit_str}"
-        )
+        # Generate log (skipped when nobody will read it)
+        log = None
+        if world.logging_enabled:
+            hit_str = "HIT" if hit else "MISS"
+            log = (
+                f"{attacker.label()} fires at {target.label()} "
+                f"(d={distance:.1f}, p={prob:.2f}, roll={roll:.2f}) -> {hit_str}"
+            )
         
         return CombatResult(
             attacker_id=attacker.id,
@@ -412,28 +437,31 @@ class CombatResolver:
         
         Returns:
             Tuple of (death_logs, killed_entity_ids)
-                death_logs: Human-readable messages about deaths
+                death_logs: Human-readable messages about deaths (empty when
+                    world.logging_enabled is False)
                 killed_entity_ids: List of entity IDs that were killed
         """
         logs: List[str] = []
         killed_ids: List[int] = []
         pending = world.get_pending_kills()
-        kill_ids = []
 
         if kill_order is None:
-            kill_ids = list(pending)
+            kill_ids = pending
         else:
-            seen = set()
-            for entity_id in kill_order:
-                if entity_id in pending and entity_id not in seen:
-                    kill_ids.append(entity_id)
-                    seen.add(entity_id)
+            # dict.fromkeys de-duplicates while keeping first-kill order
+            kill_ids = [
+                entity_id
+                for entity_id in dict.fromkeys(kill_order)
+                if entity_id in pending
+            ]
         
         for entity_id in kill_ids:
             entity = world.get_entity(entity_id)
             if entity and entity.alive:
                 entity.alive = False
-                logs.append(f"{entity.label()} was destroyed!")
+                world.get_team_view(entity.team).remove_friendly_id(entity_id)
+                if world.logging_enabled:
+                    logs.append(f"{entity.label()} was destroyed!")
                 killed_ids.append(entity_id)
         
         # Clear pending kills after applying
@@ -445,8 +473,8 @@ class CombatResolver:
         """
         Preserve the order in which kills were marked during combat resolution.
         """
-        order: List[int] = []
-        for result in combat_results:
-            if result.target_killed and result.target_id is not None:
-                order.append(result.target_id)
-        return order
+        return [
+            result.target_id
+            for result in combat_results
+            if result.target_killed and result.target_id is not None
+        ]
@@ -9,13 +9,15 @@ This module handles:
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, FrozenSet, List
 
 from ..core.types import EntityKind
 from ..core.observations import Observation
+from ._kernels import in_range_pairs
 
 if TYPE_CHECKING:
     from ..world.world import WorldState
+    from ..world.team_view import TeamView
     from ..entities.base import Entity
     from ..entities.sam import SAM
     from ..entities.decoy import Decoy
@@ -50,124 +52,87 @@ class SensorSystem:
         2. Compute observations for each living entity
         3. Aggregate observations into team views
         4. Add self-observations (entities always see themselves)
+
+        Friendly IDs are not rebuilt here; team views keep them up to date
+        as entities are added to the world or destroyed.
         
         Args:
             world: Current world state (modified in-place)
         """
         # Step 1: Reset team views for this turn
         from ..core.types import Team
-        for team in [Team.BLUE, Team.RED]:
-            world.get_team_view(team).reset()
-        
-        # Step 2: Register friendly IDs
-        for entity in world.get_alive_entities():
-            # We add entity id to it's team view as friendly
-            world.get_team_view(entity.team).add_friendly_id(entity.id)
-        
-        # Step 3: Compute observations for each entity
-        for observer in world.get_alive_entities():
-            observations = self.compute_entity_observations(world, observer)
-            world.get_team_view(observer.team).add_observations(observations)
+        team_views = {team: world.get_team_view(team) for team in [Team.BLUE, Team.RED]}
+        for team_view in team_views.values():
+            team_view.reset()
+        
+        # Step 2: Compute observations for each entity.
+        # Living rows are collected from a position snapshot in a single pass;
+        # in_range_pairs then only measures candidates inside each observer's
+        # x-range instead of calling grid.distance() for every pair.
+        snapshot = world.snapshot_positions()
+        alive: List[Entity] = []
+        positions = []
+        radars = []
+        hidden = []
+        for row, entity in enumerate(snapshot.entities):
+            if not snapshot.alive[row]:
+                continue
+            alive.append(entity)
+            positions.append(snapshot.positions[row])
+            radars.append(snapshot.radars[row])
+            hidden.append(entity.is_invisible_to_enemies())
+
+        obs_idx, tgt_idx = in_range_pairs(positions, radars, hidden)
+
+        # One seen_by singleton per living entity, shared by every
+        # observation it makes this turn (and by its self-observation).
+        singleton_seen_by = [frozenset((entity.id,)) for entity in alive]
+        for i, j in zip(obs_idx, tgt_idx):
+            observer = alive[i]
+            team_view = team_views[observer.team]
+            team_view.add_observation(
+                self._build_observation(team_view, observer, alive[j], singleton_seen_by[i])
+            )
         
-        # Step 4: Add self-observations (entities always see themselves)
-        for entity in world.get_alive_entities():
+        # Step 3: Add self-observations (entities always see themselves)
+        for entity, seen_by in zip(alive, singleton_seen_by):
             self_obs = Observation(
                 entity_id=entity.id,
                 kind=entity.kind,
                 team=entity.team,
                 position=entity.pos,
-                seen_by={entity.id}
+                seen_by=seen_by
             )
-            world.get_team_view(entity.team).add_observation(self_obs)
+            team_views[entity.team].add_observation(self_obs)
     
-    def compute_entity_observations(
-        self, 
-        world: WorldState, 
-        observer: Entity
-    ) -> List[Observation]:
+    def _build_observation(
+        self,
+        team_view: TeamView,
+        observer: Entity,
+        target: Entity,
+        seen_by: FrozenSet[int]
+    ) -> Observation:
         """
-        Compute what a single entity can observe.
-        
+        Build the observation of a target that is known to be visible.
+
         Args:
-            world: Current world state
+            team_view: Observer's team view (for enemy firing history)
             observer: Entity doing the observing
-        
-        Returns:
-            List of observations of other entities
-        """
-        observations = []
-        
-        # Dead entities can't observe
-        if not observer.alive:
-            return observations
-        
-        team_view = world.get_team_view(observer.team)
-
-        # Get active radar range (handles SAM on/off)
-        active_radar = observer.get_active_radar_range()
-        if active_radar <= 0:
-            return observations
-        
-        # Check all other entities
-        for target in world.get_all_entities():
-            # Skip self; self-knowledge is injected later regardless of sensors
-            if target.id == observer.id:
-                continue
+            target: Entity being observed
+            seen_by: Shared singleton set holding the observer's ID
 
-            # Can't observe dead entities
-            if not target.alive:
-                continue
-            
-            # Special case: SAMs with radar OFF are invisible
-            if self._is_sam_invisible(target):
-                continue
-            
-            # Check if in radar range
-            distance = world.grid.distance(observer.pos, target.pos)
-            if distance > active_radar:
-                continue
-            
-            # Determine apparent kind (handles decoy deception)
-            apparent_kind = self._get_apparent_kind(target, observer)
-            
-            # Create observation
-            obs = Observation(
-                entity_id=target.id,
-                kind=apparent_kind,
-                team=target.team,
-                position=target.pos,
-                seen_by={observer.id},
-                has_fired_before=team_view.has_enemy_fired(target.id) if target.team != observer.team else False,
-            )
-            observations.append(obs)
-        
-        return observations
-    
-    def _is_sam_invisible(self, entity: Entity) -> bool:
-        """
-        Check if a SAM is invisible (radar OFF).
-        
-        SAMs are only visible to enemies when their radar is ON.
-        When OFF, they're completely invisible.
-        
-        Args:
-            entity: Entity to check
-        
         Returns:
-            True if entity is a SAM with radar OFF
+            Observation as it appears to the observer
         """
-        # Check if it's a SAM
-        if entity.kind != EntityKind.SAM:
-            return False
-        
-        # Import here to avoid circular dependency at module level
-        from ..entities.sam import SAM
-        
-        # Check if radar is OFF
-        if isinstance(entity, SAM):
-            return not entity.on
-        
-        return False
+        return Observation(
+            entity_id=target.id,
+            # Determine apparent kind (handles decoy deception)
+            kind=self._get_apparent_kind(target, observer),
+            team=target.team,
+            position=target.pos,
+            seen_by=seen_by,
+            has_fired_before=team_view.has_enemy_fired(target.id) if target.team != observer.team else False,
+        )
     
     def _get_apparent_kind(self, target: Entity, observer: Entity) -> EntityKind:
         """
@@ -262,7 +227,7 @@ class SensorSystem:
             return False
         
         # Check if target is invisible (SAM with radar OFF)
-        if self._is_sam_invisible(target):
+        if target.is_invisible_to_enemies():
             return False
         
         return True
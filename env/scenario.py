@@ -7,18 +7,30 @@ Provides type-safe Python definitions for scenarios and JSON serialization.
 from __future__ import annotations
 from pathlib import Path
 from typing import Dict, List, Any, Optional, TYPE_CHECKING
-import json
+import copy
 import time
 
+from infra.json_io import read_json, write_json
 from infra.logger import get_logger
 from infra.paths import PROJECT_ROOT, SCENARIO_STORAGE_DIR
 from .entities.base import Entity
 from .entities import Aircraft, AWACS, SAM, Decoy
 from .core.types import Team
-from agents import AgentSpec
+from agents.spec import AgentSpec
 
 logger = get_logger(__name__)
 
+# Config defaults applied when loading scenario dicts with missing keys
+_SCENARIO_DEFAULTS: Dict[str, Any] = {
+    "grid_width": 20,
+    "grid_height": 20,
+    "max_stalemate_turns": 60,
+    "max_no_move_turns": 15,
+    "max_turns": None,
+    "check_missile_exhaustion": True,
+    "seed": None,
+}
+
 
 class Scenario:
     """
@@ -41,7 +53,7 @@ class Scenario:
                 Aircraft(team=Team.RED, pos=(18, 10), missiles=4, ...),
             ],
         )
-        scenario.save_json("my_scenario.json")
+        scenario.save_pretty_json("my_scenario.json")
         scenario = Scenario.load_json("my_scenario.json")
 """
     
@@ -101,17 +113,44 @@ class Scenario:
         Useful for running multiple environments from the same base scenario
         without sharing mutable entity objects.
         """
-        return Scenario.from_json_dict(self.to_json_dict())
+        agents = None
+        if self.agents is not None:
+            agents = self._deserialize_agents(self._serialize_agents(self.agents))
+        return Scenario(
+            grid_width=self.grid_width,
+            grid_height=self.grid_height,
+            max_stalemate_turns=self.max_stalemate_turns,
+            max_no_move_turns=self.max_no_move_turns,
+            max_turns=self.max_turns,
+            check_missile_exhaustion=self.check_missile_exhaustion,
+            seed=self.seed,
+            entities=copy.deepcopy(self.entities),
+            agents=agents,
+        )
+
+    def shallow_clone(self) -> Scenario:
+        """
+        Copy this scenario's config and lists without copying the entities.
+
+        Entities and agent specs are shared with the original, so treat the
+        result as a read-only template: GridCombatEnv.reset() clones the
+        entities it simulates, and live state belongs to the env's world.
+        Adding or removing entities on either copy does not affect the other.
+        """
+        clone = copy.copy(self)
+        clone.entities = list(self.entities)
+        if self.agents is not None:
+            clone.agents = list(self.agents)
+        return clone
     
-    def to_dict(self) -> Dict[str, Any]:
+    def _config_dict(self) -> Dict[str, Any]:
         """
-        Convert to dictionary format for env.reset().
-        
-        Returns:
-            Dict with config, entities, and optional agent specs
+        Build the "config" section shared by to_dict() and to_json_dict().
+
+        Not cached: config attributes are public and may be edited after
+        construction (e.g., setting a seed before reset).
         """
-        data = {
-            "config": {
+        return {
             "grid_width": self.grid_width,
             "grid_height": self.grid_height,
             "max_stalemate_turns": self.max_stalemate_turns,
@@ -119,7 +158,17 @@ class Scenario:
             "max_turns": self.max_turns,
             "check_missile_exhaustion": self.check_missile_exhaustion,
             "seed": self.seed,
-        },
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary format for env.reset().
+        
+        Returns:
+            Dict with config, entities, and optional agent specs
+        """
+        data = {
+            "config": self._config_dict(),
             "entities": self.entities,
         }
         if self.agents is not None:
@@ -134,15 +183,7 @@ class Scenario:
             JSON-serializable dictionary
         """
         data = {
-            "config": {
-            "grid_width": self.grid_width,
-            "grid_height": self.grid_height,
-            "max_stalemate_turns": self.max_stalemate_turns,
-            "max_no_move_turns": self.max_no_move_turns,
-            "max_turns": self.max_turns,
-            "check_missile_exhaustion": self.check_missile_exhaustion,
-            "seed": self.seed,
-        },
+            "config": self._config_dict(),
             "entities": [e.to_dict() for e in self.entities],
         }
         if self.agents is not None:
@@ -163,19 +204,12 @@ class Scenario:
         # Extract config
         config = data.get("config", {})
         scenario = cls(
-            grid_width=config.get("grid_width", 20),
-            grid_height=config.get("grid_height", 20),
-            max_stalemate_turns=config.get("max_stalemate_turns", 60),
-            max_no_move_turns=config.get("max_no_move_turns", 15),
-            max_turns=config.get("max_turns"),
-            check_missile_exhaustion=config.get("check_missile_exhaustion", True),
-            seed=config.get("seed"),
+            **{key: config.get(key, default) for key, default in _SCENARIO_DEFAULTS.items()},
             agents=cls._deserialize_agents(data.get("agents")),
         )
         
         # Load entities
-        for entity_data in data.get("entities", []):
-            scenario.entities.append(Entity.from_dict(entity_data))
+        scenario.entities.extend(Entity.from_dict(e) for e in data.get("entities", []))
         
         return scenario
 
@@ -189,13 +223,7 @@ class Scenario:
         """
         config = data.get("config", {})
         scenario = cls(
-            grid_width=config.get("grid_width", 20),
-            grid_height=config.get("grid_height", 20),
-            max_stalemate_turns=config.get("max_stalemate_turns", 60),
-            max_no_move_turns=config.get("max_no_move_turns", 15),
-            max_turns=config.get("max_turns"),
-            check_missile_exhaustion=config.get("check_missile_exhaustion", True),
-            seed=config.get("seed"),
+            **{key: config.get(key, default) for key, default in _SCENARIO_DEFAULTS.items()},
             agents=cls._deserialize_agents(data.get("agents")),
         )
 
@@ -204,8 +232,7 @@ class Scenario:
                 return Entity.from_dict(e.to_dict())
             return Entity.from_dict(e)
 
-        for entity_data in data.get("entities", []):
-            scenario.entities.append(_to_entity(entity_data))
+        scenario.entities.extend(_to_entity(e) for e in data.get("entities", []))
 
         return scenario
 
@@ -214,36 +241,36 @@ class Scenario:
         """
         Best-effort serialization for agent specs; uses to_dict when available.
         """
-        # Local import to avoid circular imports during module load
-        from agents import AgentSpec
-        serialized: List[Dict[str, Any]] = []
-        for value in agents:
-            serialized.append(value.to_dict() if isinstance(value, AgentSpec) else value)  # type: ignore[arg-type]
-        return serialized
+        return [
+            value.to_dict() if isinstance(value, AgentSpec) else value  # type: ignore[misc]
+            for value in agents
+        ]
     
     @staticmethod
     def _deserialize_agents(data: Any) -> Optional[List["AgentSpec"]]:
         if data is None:
             return None
-        # Local import to avoid circular imports during module load
-        from agents import AgentSpec
-        agents_list: List[AgentSpec] = []
-        for value in data:
-            if isinstance(value, AgentSpec):
-                agents_list.append(value)
-            elif isinstance(value, dict):
-                agents_list.append(AgentSpec.from_dict(value))
-            else:
-                raise TypeError(f"Agent definition must be AgentSpec or dict, got {type(value)}")
-        return agents_list
+        return [Scenario._deserialize_agent(value) for value in data]
+
+    @staticmethod
+    def _deserialize_agent(value: Any) -> "AgentSpec":
+        """Accept an AgentSpec as-is or build one from its dict form."""
+        if isinstance(value, AgentSpec):
+            return value
+        if isinstance(value, dict):
+            return AgentSpec.from_dict(value)
+        raise TypeError(f"Agent definition must be AgentSpec or dict, got {type(value)}")
     
-    def save_json(self, filepath: str | Path | None = None, indent: int = 2) -> None:
+    def save_json(self, filepath: str | Path | None = None, indent: Optional[int] = None) -> None:
         """
         Save scenario to JSON file.
+
+        Output is compact by default (the encoder's fast path); use
+        save_pretty_json() for files meant to be read or edited by hand.
         
         Args:
             filepath: Path to save to. If None, saves under storage/scenarios with a timestamped name.
-            indent: JSON indentation (default: 2)
+            indent: JSON indentation (default: None = compact)
         """
         if filepath is None:
             base_dir = SCENARIO_STORAGE_DIR
@@ -257,8 +284,16 @@ class Scenario:
             filepath.parent.mkdir(parents=True, exist_ok=True)
 
         logger.info("Saving scenario JSON to %s", filepath)
-        with open(filepath, 'w') as f:
-            json.dump(self.to_json_dict(), f, indent=indent, ensure_ascii=False)
+        write_json(filepath, self.to_json_dict(), indent=indent)
+
+    def save_pretty_json(self, filepath: str | Path | None = None) -> None:
+        """
+        Save scenario to an indented, human-readable JSON file.
+
+        Args:
+            filepath: Path to save to (see save_json)
+        """
+        self.save_json(filepath, indent=2)
     
     @classmethod
     def load_json(cls, filepath: str | Path) -> Scenario:
@@ -271,9 +306,7 @@ class Scenario:
         Returns:
             Loaded Scenario
         """
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        return cls.from_json_dict(data)
+        return cls.from_json_dict(read_json(filepath))
     
     def __str__(self) -> str:
         """String representation."""
@@ -288,6 +321,24 @@ class Scenario:
 # SCENARIO BUILDERS (Examples/Templates)
 # =============================================================================
 
+# Stats shared by every unit of a type in create_mixed_scenario (both teams)
+_MIXED_AIRCRAFT_STATS: Dict[str, Any] = {
+    "radar_range": 5.0,
+    "missiles": 4,
+    "missile_max_range": 4.0,
+    "base_hit_prob": 0.8,
+    "min_hit_prob": 0.1,
+}
+_MIXED_SAM_STATS: Dict[str, Any] = {
+    "radar_range": 8.0,
+    "missiles": 6,
+    "missile_max_range": 6.0,
+    "base_hit_prob": 0.8,
+    "min_hit_prob": 0.1,
+    "cooldown_steps": 5,
+}
+
+
 def create_mixed_scenario() -> Scenario:
     """
     Create a complex mixed scenario.
@@ -311,29 +362,16 @@ def create_mixed_scenario() -> Scenario:
             ),
             Aircraft(
                 team=Team.BLUE, pos=(5, 10),
-                radar_range=5.0,
-                missiles=4,
-                missile_max_range=4.0,
-                base_hit_prob=0.8,
-                min_hit_prob=0.1
+                **_MIXED_AIRCRAFT_STATS
             ),
             Aircraft(
                 team=Team.BLUE, pos=(5, 12),
-                radar_range=5.0,
-                missiles=4,
-                missile_max_range=4.0,
-                base_hit_prob=0.8,
-                min_hit_prob=0.1
+                **_MIXED_AIRCRAFT_STATS
             ),
             SAM(
                 team=Team.BLUE, pos=(2, 2),
-                radar_range=8.0,
-                missiles=6,
-                missile_max_range=6.0,
-                base_hit_prob=0.8,
-                min_hit_prob=0.1,
-                cooldown_steps=5,
-                on=True
+                on=True,
+                **_MIXED_SAM_STATS
             ),
             # Red team - Combined arms
             AWACS(
@@ -342,30 +380,17 @@ def create_mixed_scenario() -> Scenario:
             ),
             Aircraft(
                 team=Team.RED, pos=(15, 10),
-                radar_range=5.0,
-                missiles=4,
-                missile_max_range=4.0,
-                base_hit_prob=0.8,
-                min_hit_prob=0.1
+                **_MIXED_AIRCRAFT_STATS
             ),
             Aircraft(
                 team=Team.RED, pos=(15, 8),
-                radar_range=5.0,
-                missiles=4,
-                missile_max_range=4.0,
-                base_hit_prob=0.8,
-                min_hit_prob=0.1
+                **_MIXED_AIRCRAFT_STATS
             ),
             Decoy(team=Team.RED, pos=(16, 10)),
             SAM(
                 team=Team.RED, pos=(18, 12),
-                radar_range=8.0,
-                missiles=6,
-                missile_max_range=6.0,
-                base_hit_prob=0.8,
-                min_hit_prob=0.1,
-                cooldown_steps=5,
-                on=False
+                on=False,
+                **_MIXED_SAM_STATS
             )
         ]
     )
@@ -376,4 +401,4 @@ if __name__ == "__main__":
     from infra.logger import configure_logging
     configure_logging(level="INFO", json=True)
     scenario = create_mixed_scenario()
-    scenario.save_json()
+    scenario.save_pretty_json()
@@ -5,14 +5,16 @@ This module provides:
 - Grid: Spatial logic and geometry
 - TeamView: Per-team observation system
 - WorldState: Central game state manager
+- PositionSnapshot: Column-oriented entity view for bulk queries
 """
 
 from .grid import Grid
 from .team_view import TeamView
-from .world import WorldState
+from .world import WorldState, PositionSnapshot
 
 __all__ = [
     "Grid",
     "TeamView",
     "WorldState",
+    "PositionSnapshot",
 ]
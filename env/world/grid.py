@@ -135,12 +135,12 @@ class Grid:
         cx, cy = center
         r = int(math.ceil(max_range))
         positions = []
+        hypot = math.hypot
 
         for y in range(max(0, cy - r), min(self.height, cy + r + 1)):
             for x in range(max(0, cx - r), min(self.width, cx + r + 1)):
-                pos = (x, y)
-                if self.distance(center, pos) <= max_range:
-                    positions.append(pos)
+                if hypot(cx - x, cy - y) <= max_range:
+                    positions.append((x, y))
 
         return positions
 
@@ -42,11 +42,12 @@ class TeamView:
         self._enemy_firing_history: Dict[int, bool] = {}
 
     def reset(self) -> None:
-        """Clear all observations and tracking (called each turn)."""
+        """Clear observations and visibility tracking (called each turn)."""
         self._observations.clear()
-        self._friendly_ids.clear()
         self._visible_enemy_ids.clear()
-        # Note: firing history persists across turns
+        # Note: firing history persists across turns.
+        # Friendly IDs are maintained incrementally by the world (added on
+        # spawn, removed on death) rather than rebuilt every turn.
 
     def add_friendly_id(self, entity_id: int) -> None:
         """
@@ -57,6 +58,15 @@ class TeamView:
         """
         self._friendly_ids.add(entity_id)
 
+    def remove_friendly_id(self, entity_id: int) -> None:
+        """
+        Unregister a friendly entity ID (e.g., after it is destroyed).
+
+        Args:
+            entity_id: ID of friendly entity
+        """
+        self._friendly_ids.discard(entity_id)
+
     def add_observation(self, obs: Observation) -> None:
         """
         Add a single observation.
@@ -172,6 +182,23 @@ class TeamView:
                 f"friendly_ids={self._friendly_ids}, "
                 f"visible_enemy_ids={self._visible_enemy_ids})")
 
+    def copy(self) -> TeamView:
+        """
+        Copy the full view, including derived sensor state.
+
+        Unlike a to_dict()/from_dict() round trip, observations, friendly
+        IDs and visible enemies are kept, so no sensor refresh is needed.
+
+        Returns:
+            Independent TeamView with identical contents
+        """
+        view = TeamView(self.team)
+        view._observations = self._observations.copy()
+        view._friendly_ids = set(self._friendly_ids)
+        view._visible_enemy_ids = set(self._visible_enemy_ids)
+        view._enemy_firing_history = dict(self._enemy_firing_history)
+        return view
+
     # ========================================================================
     # SERIALIZATION
     # ========================================================================
@@ -180,8 +207,9 @@ class TeamView:
         Serialize TeamView state to dictionary.
 
         Note: Only persistent state (_enemy_firing_history) is serialized.
-        Derived state (observations, friendly_ids, visible_enemy_ids) is
-        regenerated after loading via SensorSystem.refresh_all_observations().
+        Derived state is regenerated after loading: friendly_ids by
+        WorldState.from_dict(), observations and visible_enemy_ids via
+        SensorSystem.refresh_all_observations().
 
         Returns:
             Dictionary with persistent state
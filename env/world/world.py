@@ -10,7 +10,9 @@ The WorldState is the heart of the simulation. It:
 
 from __future__ import annotations
 
+import copy
 import json
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Set, Any
 import random
 
@@ -19,6 +21,28 @@ from .team_view import TeamView
 from ..entities.base import Entity
 from ..core.types import Team, GridPos, GameResult
 from ..core.actions import Action
+from ..mechanics.squares_rng import derive_key
+
+
+@dataclass(frozen=True)
+class PositionSnapshot:
+    """
+    Column-oriented, read-only view of entity state for bulk queries.
+
+    Row i of every column describes entities[i]. Hot read-only paths (e.g.,
+    sensing) index these columns instead of walking entity objects; entities
+    themselves remain the place to mutate state.
+
+    Attributes:
+        entities: All entities, in world order
+        positions: Grid positions
+        alive: Alive flags
+        radars: Active radar range (0.0 when dead or radar is off)
+    """
+    entities: List[Entity]
+    positions: List[GridPos]
+    alive: List[bool]
+    radars: List[float]
 
 
 class WorldState:
@@ -42,7 +66,9 @@ class WorldState:
             self,
             width: int,
             height: int,
-            seed: Optional[int] = None
+            seed: Optional[int] = None,
+            *,
+            rng_key: Optional[int] = None
     ):
         """
         Initialize a new world.
@@ -51,6 +77,7 @@ class WorldState:
             width: Grid width
             height: Grid height
             seed: Random seed for reproducibility
+            rng_key: Existing combat key to reuse (None = derive from seed)
         """
         # Spatial grid
         self.grid = Grid(width, height)
@@ -76,9 +103,16 @@ class WorldState:
         # Random number generator
         self.rng = random.Random(seed)
 
+        # Key for counter-based draws (combat hit rolls), see squares_rng
+        self.rng_key: int = rng_key if rng_key is not None else derive_key(seed)
+
         # Kill tracking (for this turn)
         self._pending_kills: Set[int] = set()
 
+        # Build human-readable combat/death log strings. Headless runs
+        # (e.g., RL training) that never read them can switch this off.
+        self.logging_enabled: bool = True
+
     # ========================================================================
     # ENTITY MANAGEMENT
     # ========================================================================
@@ -104,6 +138,8 @@ class WorldState:
 
         self._entities.append(entity)
         self._entities_by_id[entity.id] = entity
+        if entity.alive:
+            self._team_views[entity.team].add_friendly_id(entity.id)
 
         return entity.id
 
@@ -143,6 +179,24 @@ class WorldState:
             entities = [e for e in entities if e.alive]
         return entities
 
+    def snapshot_positions(self) -> PositionSnapshot:
+        """
+        Capture entity state as parallel columns for read-only bulk queries.
+
+        The snapshot is not kept in sync with later mutations; take a new
+        one after movement or deaths.
+
+        Returns:
+            PositionSnapshot covering all entities (including dead ones)
+        """
+        entities = self._entities.copy()
+        return PositionSnapshot(
+            entities=entities,
+            positions=[e.pos for e in entities],
+            alive=[e.alive for e in entities],
+            radars=[e.get_active_radar_range() for e in entities],
+        )
+
     def is_position_occupied(self, pos: GridPos) -> bool:
         """
         Check if a position is occupied by a living entity.
@@ -223,6 +277,8 @@ class WorldState:
             "turns_without_shooting": self.turns_without_shooting,
             "turns_without_movement": self.turns_without_movement,
             "rng_state": self.rng.getstate(),
+            # String: the 64-bit key would lose precision as a JSON/JS number
+            "rng_key": str(self.rng_key),
         }
 
     @classmethod
@@ -236,11 +292,13 @@ class WorldState:
         Returns:
             Reconstructed WorldState
         """
-        # Create empty world
+        # Create empty world (older payloads without a key get a fresh one)
+        rng_key = data.get("rng_key")
         world = cls(
             width=data["grid"]["width"],
             height=data["grid"]["height"],
-            seed=None
+            seed=None,
+            rng_key=int(rng_key) if rng_key is not None else None,
         )
 
         # Restore game state
@@ -273,6 +331,11 @@ class WorldState:
             for team_name, team_view_data in data["team_views"].items():
                 team = Team[team_name]
                 world._team_views[team] = TeamView.from_dict(team_view_data)
+
+        # Friendly IDs are not serialized; rebuild them from living entities
+        for entity in world._entities:
+            if entity.alive:
+                world._team_views[entity.team].add_friendly_id(entity.id)
         
         # Note: After loading, call SensorSystem.refresh_all_observations()
         # to regenerate derived state (observations, visible enemies, etc.)
@@ -334,6 +397,39 @@ class WorldState:
         """
         return WorldState.from_dict(self.to_dict())
 
+    def snapshot(self) -> WorldState:
+        """
+        Create an independent copy that keeps derived sensor state.
+
+        Cheaper than clone(): entities and team views are copied directly
+        instead of going through to_dict()/from_dict(), and observations do
+        not have to be regenerated with SensorSystem afterwards.
+
+        Returns:
+            Independent copy of this WorldState, observations included
+        """
+        world = WorldState(
+            width=self.grid.width, height=self.grid.height, seed=None, rng_key=self.rng_key
+        )
+
+        world._entities = copy.deepcopy(self._entities)
+        world._entities_by_id = {entity.id: entity for entity in world._entities}
+        world._team_views = {
+            team: team_view.copy() for team, team_view in self._team_views.items()
+        }
+
+        world.turn = self.turn
+        world.game_over = self.game_over
+        world.winner = self.winner
+        world.game_over_reason = self.game_over_reason
+        world.turns_without_shooting = self.turns_without_shooting
+        world.turns_without_movement = self.turns_without_movement
+        world.rng.setstate(self.rng.getstate())
+        world._pending_kills = set(self._pending_kills)
+        world.logging_enabled = self.logging_enabled
+
+        return world
+
     def __str__(self) -> str:
         """String representation."""
         alive = len(self.get_alive_entities())
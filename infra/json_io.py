@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# JSON helpers shared by file I/O paths (scenarios, cached API payloads).
+# - orjson is used when installed (several times faster to encode/decode).
+# - Without it, the stdlib json module produces equivalent UTF-8 output.
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib fallback below
+    orjson = None
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: Optional[int] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Encode an object as UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Indentation width (None = compact). orjson only supports 2;
+            other widths use the stdlib encoder.
+        default: Fallback for objects the encoder cannot serialize natively
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        return orjson.dumps(obj, default=default, option=option)
+
+    separators = None if indent is not None else (",", ":")
+    return json.dumps(
+        obj, indent=indent, default=default, ensure_ascii=False, separators=separators
+    ).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Decode JSON from bytes or text.
+
+    Args:
+        data: Encoded JSON
+
+    Returns:
+        Decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(
+    path: str | Path,
+    obj: Any,
+    *,
+    indent: Optional[int] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> None:
+    """
+    Encode an object and write it to a file in one call.
+
+    Args:
+        path: Destination file
+        obj: JSON-serializable object
+        indent: Indentation width (None = compact)
+        default: Fallback for objects the encoder cannot serialize natively
+    """
+    Path(path).write_bytes(dumps(obj, indent=indent, default=default))
+
+
+def read_json(path: str | Path) -> Any:
+    """
+    Read and decode a JSON file.
+
+    Args:
+        path: Source file
+
+    Returns:
+        Decoded object
+    """
+    return loads(Path(path).read_bytes())
@@ -2,18 +2,41 @@
 
 from __future__ import annotations
 
+import contextlib
+import copy
+import functools
+import gzip
 import json
+import os
+import tempfile
 import urllib.error
 import urllib.request
 from typing import Any, Iterable
 
+from infra import json_io
+from infra.logger import get_logger
+from infra.paths import STORAGE_DIR
 
-def fetch_models(base_url: str = "https://openrouter.ai/api/v1") -> list[dict[str, Any]]:
+log = get_logger(__name__)
+
+# Last /models response per base URL, with its ETag for revalidation.
+MODELS_CACHE_PATH = STORAGE_DIR / "openrouter_models.json"
+
+
+def fetch_models(
+    base_url: str = "https://openrouter.ai/api/v1",
+    use_cache: bool = True,
+) -> list[dict[str, Any]]:
     """
     Fetch the list of models from OpenRouter.
 
+    The last response is cached on disk (see MODELS_CACHE_PATH) together with
+    its ETag; later calls revalidate with If-None-Match and reuse the cached
+    list when the server answers 304 Not Modified.
+
     Args:
         base_url: Override for testing.
+        use_cache: Revalidate against / update the on-disk cache.
 
     Returns:
         List of model dicts.
@@ -21,13 +44,24 @@ def fetch_models(base_url: str = "https://openrouter.ai/api/v1") -> list[dict[st
     Raises:
         RuntimeError: For HTTP/parse errors.
     """
-    headers = {"Accept": "application/json"}
+    # The model list is large and compresses well; urllib does not decode gzip itself.
+    headers = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+
+    cached = _read_cached_models(base_url) if use_cache else None
+    if cached is not None:
+        headers["If-None-Match"] = cached["etag"]
 
     req = urllib.request.Request(f"{base_url.rstrip('/')}/models", headers=headers)
     try:
         with urllib.request.urlopen(req) as resp:  # nosec B310 (external HTTP call expected)
-            payload = json.load(resp)
+            etag = resp.headers.get("ETag")
+            raw = resp.read()
+            if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+                raw = gzip.decompress(raw)
+        payload = json_io.loads(raw)
     except urllib.error.HTTPError as exc:
+        if exc.code == 304 and cached is not None:
+            return list(cached["data"])
         raise RuntimeError(f"OpenRouter returned HTTP {exc.code}: {exc.reason}") from exc
     except Exception as exc:
         raise RuntimeError(f"Failed to fetch models: {exc}") from exc
@@ -35,7 +69,49 @@ def fetch_models(base_url: str = "https://openrouter.ai/api/v1") -> list[dict[st
     data = payload.get("data")
     if not isinstance(data, Iterable):
         raise RuntimeError("OpenRouter response missing 'data' list")
-    return list(data)
+    models = list(data)
+
+    if use_cache and etag:
+        _write_cached_models(base_url, etag, models)
+    return models
+
+
+def _read_cached_models(base_url: str) -> dict[str, Any] | None:
+    """Return the cached {"etag", "data"} entry for base_url, if usable."""
+    try:
+        entry = json_io.read_json(MODELS_CACHE_PATH).get(base_url)
+    except (OSError, ValueError, AttributeError):
+        return None
+    if not isinstance(entry, dict) or not entry.get("etag") or not isinstance(entry.get("data"), list):
+        return None
+    return entry
+
+
+def _write_cached_models(base_url: str, etag: str, models: list[dict[str, Any]]) -> None:
+    """Store models + ETag for base_url; failures only cost a future re-download."""
+    try:
+        cache = json_io.read_json(MODELS_CACHE_PATH)
+        if not isinstance(cache, dict):
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+    cache[base_url] = {"etag": etag, "data": models}
+
+    try:
+        MODELS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Write a uniquely named file next to the target and rename it, so
+        # readers and concurrent writers never see a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=MODELS_CACHE_PATH.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(json_io.dumps(cache))
+            os.replace(tmp_name, MODELS_CACHE_PATH)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+    except OSError as exc:
+        log.warning("Could not write OpenRouter model cache %s: %s", MODELS_CACHE_PATH, exc)
 
 
 def find_model_by_id(
@@ -48,13 +124,25 @@ def find_model_by_id(
 
     Args:
         model_id: Exact model id to locate (e.g., \"qwen/qwen3-coder:exacto\").
-        pretty: If True, return a JSON-formatted string; otherwise return the raw dict.
+        pretty: If True, return a JSON-formatted string; otherwise return a copy of the dict.
+    """
+    model = _models_by_id(base_url).get(model_id)
+    if model is None:
+        return None
+    # The index is cached and shared; hand out a copy so callers can't corrupt it
+    return json.dumps(model, indent=2, sort_keys=True) if pretty else copy.deepcopy(model)
+
+
+@functools.lru_cache(maxsize=8)
+def _models_by_id(base_url: str) -> dict[str, dict[str, Any]]:
+    """
+    Index the model list by id, fetched once per base_url per process.
+
+    The returned dict is shared between callers and must be treated as
+    read-only. Call _models_by_id.cache_clear() to pick up a newer model list.
     """
-    models = fetch_models(base_url=base_url)
-    for model in models:
-        if model.get("id") == model_id:
-            return json.dumps(model, indent=2, sort_keys=True) if pretty else model
-    return None
+    # Reversed so the first record wins on duplicate ids, like a linear scan
+    return {model.get("id"): model for model in reversed(fetch_models(base_url=base_url))}
 
 
 if __name__ == "__main__":
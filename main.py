@@ -1,20 +1,11 @@
 """Local launcher that runs the API and serves the UI from one command."""
 
 import argparse
-import threading
-import webbrowser
+import os
 
-import uvicorn
-
-from infra.logger import STORAGE_DIR, configure_logging, get_logger
-
-
-
-def _open_browser(url: str, delay: float = 1.0) -> None:
-    """Open the UI in the default browser after the server spins up."""
-    timer = threading.Timer(delay, lambda: webbrowser.open(url))
-    timer.daemon = True
-    timer.start()
+# Read by api.app's lifespan hook (see api.app.OPEN_BROWSER_ENV); not imported
+# from there so --help does not load the app.
+OPEN_BROWSER_ENV = "WG_OPEN_BROWSER_URL"
 
 
 def main():
@@ -37,13 +28,18 @@ def main():
     parser.add_argument("--no-browser", action="store_true", help="Do not auto-open the UI in the browser")
     args = parser.parse_args()
 
+    # Deferred so --help and argument errors return without loading the server stack.
+    import uvicorn
+
+    from infra.logger import configure_logging, get_logger
+
     # Configure logging once at startup (console + file).
     configure_logging(level="INFO", json=True)
     log = get_logger(__name__)
 
     url = f"http://{args.host}:{args.port}"
     if not args.no_browser:
-        _open_browser(url)
+        os.environ[OPEN_BROWSER_ENV] = url
 
     """
     FastAPI is just Python code describing endpoints.
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Optional
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
 from env.core.actions import Action
-from env.core.types import Team
+from env.core.types import EntityKind, Team
+from env.entities import SAM, Aircraft
+from env.entities.base import Entity
 from env.environment import StepInfo
 from env.world import WorldState
 
+# Enum iteration and name lookups go through the enum machinery; precompute
+# the member tuple and wire strings once.
+_TEAMS: tuple[Team, ...] = tuple(Team)
+_TEAM_NAME = {team: team.name for team in _TEAMS}
+_TEAM_NAME_LOWER = {team: team.name.lower() for team in _TEAMS}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Frame:
     """
     Immutable snapshot of a single turn, with helpers to serialize for transport.
@@ -54,11 +63,11 @@ class Frame:
         lean; UI can still filter entities by IDs.
         """
         observations: Dict[str, Any] = {}
-        for team in Team:
+        for team in _TEAMS:
             view = world.get_team_view(team)
             obs_list = view.get_all_observations()
 
-            observations[team.name.lower()] = {
+            observations[_TEAM_NAME_LOWER[team]] = {
                 "entities": [obs.to_dict() for obs in obs_list],
                 "friendly_ids": sorted(view.get_friendly_ids()),
                 "visible_enemy_ids": sorted(view.get_enemy_ids(team)),
@@ -71,45 +80,86 @@ class Frame:
         """
         Serialize entities for the frontend without altering canonical world dict.
         """
-        serialized: List[Dict[str, Any]] = []
-
-        for entity in world.get_all_entities():
-            data: Dict[str, Any] = {
-                "id": entity.id,
-                "team": entity.team.name,
-                "kind": entity.kind.value,
-                "type": entity.__class__.__name__,
-                "name": entity.name,
-                "position": list(entity.pos),
-                "alive": entity.alive,
-                "is_alive": entity.alive,
-                "can_move": entity.can_move,
-                "can_shoot": entity.can_shoot,
-                "radar_range": getattr(entity, "radar_range", 0),
-                "active_radar": entity.get_active_radar_range(),
-                "missiles": getattr(entity, "missiles", None),
-                "missile_max_range": getattr(entity, "missile_max_range", None),
+        serializers = _ENTITY_SERIALIZERS
+        return [
+            serializers.get(entity.kind, _entity_row)(entity)
+            for entity in world.get_all_entities()
+        ]
+
+    @staticmethod
+    def _serialize_actions(actions: Mapping[int, Action]) -> list[Dict[str, Any]]:
+        """Serialize action map to a list for easy iteration client-side."""
+        return [
+            {
+                "entity_id": entity_id,
+                "type": action.type.name,
+                "params": action.params_to_dict(),
+                "label": str(action),
             }
+            for entity_id, action in actions.items()
+        ]
 
-            # SAM-specific fields (optional)
-            data["radar_on"] = getattr(entity, "on", None)
-            data["cooldown_remaining"] = getattr(entity, "_cooldown", None)
 
-            serialized.append(data)
+# ============================================================================
+# ENTITY ROWS
+# ============================================================================
 
-        return serialized
+# Fields shared by every entity, fetched in one C-level call per row
+_ENTITY_ATTRS = attrgetter(
+    "id", "team", "kind", "name", "pos", "alive", "can_move", "can_shoot", "radar_range"
+)
 
-    @staticmethod
-    def _serialize_actions(actions: Mapping[int, Action]) -> list[Dict[str, Any]]:
-        """Serialize action map to a list for easy iteration client-side."""
-        serialized: list[Dict[str, Any]] = []
-        for entity_id, action in actions.items():
-            serialized.append(
-                {
-                    "entity_id": entity_id,
-                    "type": action.type.name,
-                    "params": action.to_dict().get("params", {}),
-                    "label": str(action),
-                }
-            )
-        return serialized
+
+def _entity_row(
+    entity: Entity,
+    missiles: Optional[int] = None,
+    missile_max_range: Optional[float] = None,
+    radar_on: Optional[bool] = None,
+    cooldown_remaining: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Build one frontend entity row.
+
+    Kind-specific fields are passed in by the per-class serializers below;
+    entities without them (AWACS, decoys) use this directly.
+    """
+    eid, team, kind, name, pos, alive, can_move, can_shoot, radar_range = _ENTITY_ATTRS(entity)
+    return {
+        "id": eid,
+        "team": _TEAM_NAME[team],
+        "kind": kind.value,
+        "type": entity.__class__.__name__,
+        "name": name,
+        "position": pos,  # tuple; encodes as a JSON array
+        "alive": alive,
+        "is_alive": alive,
+        "can_move": can_move,
+        "can_shoot": can_shoot,
+        "radar_range": radar_range,
+        "active_radar": entity.get_active_radar_range(),
+        "missiles": missiles,
+        "missile_max_range": missile_max_range,
+        # SAM-specific fields (optional)
+        "radar_on": radar_on,
+        "cooldown_remaining": cooldown_remaining,
+    }
+
+
+def _aircraft_row(entity: Aircraft) -> Dict[str, Any]:
+    """Entity row with aircraft weapon fields."""
+    return _entity_row(entity, entity.missiles, entity.missile_max_range)
+
+
+def _sam_row(entity: SAM) -> Dict[str, Any]:
+    """Entity row with SAM weapon, radar and cooldown fields."""
+    return _entity_row(
+        entity, entity.missiles, entity.missile_max_range, entity.on, entity._cooldown
+    )
+
+
+# Dispatch on the true entity kind, so subclasses keep their weapon fields;
+# kinds without extra fields fall back to _entity_row.
+_ENTITY_SERIALIZERS: Dict[EntityKind, Callable[[Any], Dict[str, Any]]] = {
+    EntityKind.AIRCRAFT: _aircraft_row,
+    EntityKind.SAM: _sam_row,
+}
@@ -6,7 +6,6 @@ from agents import BaseAgent, create_agent_from_spec
 from env import GridCombatEnv
 from env.core.types import Team
 from env.environment import StepInfo
-from env.mechanics.sensors import SensorSystem
 from env.scenario import Scenario
 from env.world import WorldState
 
@@ -28,11 +27,15 @@ class GameRunner:
         scenario: Scenario,
         world: WorldState | Dict[str, Any] | None = None,
         verbose: bool = False,
+        env: GridCombatEnv | None = None,
     ):
-        self.scenario = scenario.clone()
+        # Template only; env.reset() deep-copies the entities it simulates
+        self.scenario = scenario.shallow_clone()
         self.verbose = verbose
 
-        self.env = GridCombatEnv(verbose=verbose)
+        # A caller running many episodes can pass one env to reuse; reset()
+        # replaces all of its per-game state (world, scenario, victory checker).
+        self.env = env if env is not None else GridCombatEnv(verbose=verbose)
         self._state = self.env.reset(scenario=self.scenario, world=world)
 
         self._blue_agent = self._agent_from_scenario(self.scenario, Team.BLUE)
@@ -89,7 +92,8 @@ class GameRunner:
             raise RuntimeError("Game is already finished")
 
         injections = injections or {}
-        world_before: WorldState = self._clone_world_with_observations(self._state["world"])
+        # env.step() mutates the world in place, so the frame needs a copy
+        world_before: WorldState = self._state["world"].snapshot()
         blue_actions, blue_meta = self._blue_agent.get_actions(
             self._state,
             step_info=self._last_info,
@@ -105,7 +109,8 @@ class GameRunner:
         self._state, _rewards, self._done, self._last_info = self.env.step(merged_actions)
 
         if self._done:
-            self._final_world = self._clone_world_with_observations(self._state["world"])
+            # No further steps run once done, so the live world is final as-is
+            self._final_world = self._state["world"]
 
         return Frame(
             world=world_before,
@@ -141,7 +146,7 @@ class GameRunner:
         Return the final world state without actions for terminal view.
         """
         world: WorldState | None = self._state.get("world")
-        return Frame(world=self._clone_world_with_observations(world) if world else None, done=True)
+        return Frame(world=world.snapshot() if world else None, done=True)
 
     # Helpers
     def _agent_from_scenario(self, scenario: Scenario, team: Team) -> BaseAgent:
@@ -153,16 +158,3 @@ class GameRunner:
         if len(matches) > 1:
             raise ValueError(f"Multiple AgentSpecs found for team {team}")
         return create_agent_from_spec(matches[0])
-
-    def _clone_world_with_observations(self, world: WorldState) -> WorldState:
-        """
-        Clone the world and regenerate derived observation data.
-
-        Cloning strips transient sensor state (team views/visible ids)
-        because WorldState.to_dict() only persists persistent fields.
-        We refresh observations on the clone so UI consumers still get
-        the correct fog-of-war view.
-        """
-        clone = world.clone()
-        SensorSystem().refresh_all_observations(clone)
-        return clone